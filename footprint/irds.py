@@ -9,20 +9,21 @@ from .cli import cli
 from .systemd import make_args
 from .systemd import systemd
 from .utils import get_pass
+from .utils import rmfiles
 from .utils import which
 
 
 def mount_irds(path_str: str, user: str | None = None) -> int:
     from .config import get_config
     from pathlib import Path
+    from tempfile import mkstemp
     import os
 
     sudo = which("sudo")
     mount = which("mount")
 
     path = Path(path_str).expanduser().absolute()
-    if not path.exists():
-        path.mkdir(exist_ok=True, parents=True)
+    path.mkdir(exist_ok=True, parents=True)
 
     datastore = path / "datastore"
     if datastore.exists():
@@ -33,22 +34,31 @@ def mount_irds(path_str: str, user: str | None = None) -> int:
     uid = os.getuid()
     gid = os.getgid()
     pheme = get_pass("PHEME", f"user {user} pheme")
-    cmd = [
-        sudo,
-        mount,
-        "-t",
-        "cifs",
-        "-o",
-        f"user={user}",
-        "-o",
-        f"pass={pheme}",
-        "-o",
-        f"uid={uid},gid={gid},forceuid,forcegid",
-        get_config().datastore,
-        str(path),
-    ]
-    pmount = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    returncode = pmount.wait()
+    # keep the password off the command line (and out of /proc/*/cmdline)
+    fd, credentials = mkstemp(prefix="footprint-", suffix=".cred")
+    try:
+        with os.fdopen(fd, "w") as fp:
+            fp.write(f"username={user}\npassword={pheme}\n")
+        cmd = [
+            sudo,
+            mount,
+            "-t",
+            "cifs",
+            "-o",
+            f"credentials={credentials}",
+            "-o",
+            f"uid={uid},gid={gid},forceuid,forcegid",
+            get_config().datastore,
+            str(path),
+        ]
+        pmount = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        returncode = pmount.wait()
+    finally:
+        rmfiles([credentials])
     return returncode
 
 
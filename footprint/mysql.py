@@ -2,7 +2,16 @@ from __future__ import annotations
 
 import os
 import subprocess
+import sys
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from dataclasses import replace
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from shutil import copyfileobj
+from typing import Any
 from typing import NamedTuple
 
 import click
@@ -10,8 +19,12 @@ import click
 from .cli import cli
 from .url import make_url
 from .url import URL
+from .utils import get_pass
 from .utils import human
+from .utils import is_local
+from .utils import rmfiles
 from .utils import which
+from .utils import which_opt
 
 DB_SIZE = """
 SELECT table_name,
@@ -24,15 +37,9 @@ WHERE table_schema = '{db}'
 """
 
 
-DB_SIZE2 = """
-SELECT table_name as "table",
-    data_length + index_length as "total_bytes"
-FROM information_schema.TABLES
-WHERE table_schema = '{db}'
-"""
 DB_SIZE3 = """
 SELECT
-    sum(data_length + index_length) as "total_bytes"
+    coalesce(sum(data_length + index_length), 0) as "total_bytes"
 FROM information_schema.TABLES
 WHERE table_schema = '{db}'
 """
@@ -78,33 +85,150 @@ class MySQLError(RuntimeError):
     pass
 
 
-def mysql_cmd(mysqlexe: str, db: URL, nodb: bool = False) -> list[str]:
+def optvalue(val: str) -> str:
+    val = val.replace("\\", "\\\\")
+    return f"'{val}'" if '"' in val else f'"{val}"'
+
+
+@lru_cache(maxsize=16)
+def defaults_file(password: str) -> str:
+    """Write the password to a private [client] option file
+
+    This keeps it out of the process table. The file is removed at exit.
+    """
+    import atexit
+    from tempfile import mkstemp
+
+    # mkstemp creates the file with 0600 permissions
+    fd, path = mkstemp(prefix="footprint-", suffix=".cnf")
+    with os.fdopen(fd, "w", encoding="utf-8") as fp:
+        fp.write(f"[client]\npassword={optvalue(password)}\n")
+    atexit.register(rmfiles, [path])
+    return path
+
+
+@lru_cache(maxsize=16)
+def mysql_argv(
+    mysqlexe: str,
+    username: str | None,
+    password: str | None,
+    port: int | None,
+    host: str | None,
+    database: str | None,
+) -> tuple[str, ...]:
     cmd = [mysqlexe]
-    if db.username is not None:
-        cmd.append(f"--user={db.username}")
-    if db.password is not None:
-        cmd.append(f"--password={db.password}")
-    else:
+    if password is not None:
+        # has to be the first option. Unlike --defaults-extra-file (which
+        # ~/.my.cnf overrides) this is the *only* option file read so the
+        # URL's password wins, as it did on the command line
+        cmd.append(f"--defaults-file={defaults_file(password)}")
+    if username is not None:
+        cmd.append(f"--user={username}")
+    if password is None:
         cmd.append("-p")
-    if db.port is not None:
-        cmd.append(f"--port={db.port}")
-    if db.host:
-        cmd.append(f"--host={db.host}")
-    if db.database and not nodb:
-        cmd.append(db.database)
-    return cmd
+    if port is not None:
+        cmd.append(f"--port={port}")
+    if host:
+        cmd.append(f"--host={host}")
+    if database:
+        cmd.append(database)
+    return tuple(cmd)
+
+
+def mysql_cmd(mysqlexe: str, db: URL, nodb: bool = False) -> list[str]:
+    # URL isn't hashable (query is a dict) so cache on its connection fields
+    return list(
+        mysql_argv(
+            mysqlexe,
+            db.username,
+            db.password,
+            db.port,
+            db.host,
+            None if nodb else db.database,
+        ),
+    )
+
+
+def ask_password(url: URL) -> URL:
+    """Prompt for a missing password up front: concurrent clients
+    run with -p would all be reading the same tty"""
+    if url.password is not None:
+        return url
+    user = f"mysql {url.username}" if url.username else "mysql"
+    return replace(url, password=get_pass("MYSQL_PWD", user))
+
+
+ZST_EXT = ".zst"
+
+
+def gzip_cmd(zstd: bool = False) -> list[str]:
+    """Prefer parallel pigz (gzip compatible output) over gzip"""
+    if zstd:
+        return [which("zstd"), "-T0", "-3", "-q", "-c"]
+    pigz = which_opt("pigz")
+    if pigz is not None:
+        return [pigz, f"-p{os.cpu_count() or 1}"]
+    return [which("gzip")]
+
+
+def zcat_cmd(filename: str = "") -> list[str]:
+    if filename.endswith(ZST_EXT):
+        return [which("zstd"), "-dc", "-q"]
+    pigz = which_opt("pigz")
+    if pigz is not None:
+        return [pigz, "-dc"]
+    return [which("zcat")]
+
+
+def fadvise(fd: int, advice: str) -> None:
+    """Give the kernel a page cache hint about fd e.g. "POSIX_FADV_SEQUENTIAL"
+    (a no-op where posix_fadvise is unavailable e.g. macOS)"""
+    if not hasattr(os, "posix_fadvise") or not hasattr(os, advice):
+        return
+    with suppress(OSError):
+        os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+
+
+def grow_pipe(fd: int, size: int = 1 << 20) -> None:
+    """Enlarge a pipe's kernel buffer (Linux only) so bulk
+    data crosses it in fewer, larger chunks"""
+    if not sys.platform.startswith("linux"):
+        return
+    import fcntl
+
+    with suppress(OSError):
+        fcntl.fcntl(fd, getattr(fcntl, "F_SETPIPE_SZ", 1031), size)
 
 
 def waitfor(procs: list[subprocess.Popen[bytes]]) -> bool:
+    """Wait for all of a pipeline's processes, failing on the first
+    that exits with an error (the remaining processes are terminated)"""
     ok = True
-    for p in procs:
-        returncode = p.wait()
-        if returncode != 0:
-            ok = False
+    with ThreadPoolExecutor(max_workers=len(procs) or 1) as executor:
+        futures = {executor.submit(p.wait): p for p in procs}
+        for future in as_completed(futures):
+            if future.result() != 0 and ok:
+                ok = False
+                for p in procs:
+                    if p.poll() is None:
+                        p.terminate()
     return ok
 
 
+SENTINEL = b"__footprint_sentinel__"
+
+
+def errmsg(stderr: bytes) -> str:
+    return stderr.decode("utf-8", errors="replace").strip()
+
+
 class MySQLRunner:
+    """Run queries with the mysql client.
+
+    Used as a context manager a single mysql process is kept
+    open and reused for all queries until the block exits.
+    """
+
     def __init__(
         self,
         url: str | URL,
@@ -115,79 +239,221 @@ class MySQLRunner:
         mysqlcmd = which(mysqlcmd)
         self.mysql = mysqlcmd
         self.cmds = cmds
+        self.procs: dict[bool, subprocess.Popen[bytes]] | None = None
 
-    def run(self, query: str | None, nodb: bool = False) -> list[list[str]]:
-        db = self.url
+    def __enter__(self) -> MySQLRunner:
+        self.procs = {}
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        procs, self.procs = self.procs, None  # back to one process per query
+        for p in (procs or {}).values():
+            p.communicate()
 
-        cmd = mysql_cmd(self.mysql, db, nodb=nodb)
+    def command(self, nodb: bool = False) -> list[str]:
+        cmd = mysql_cmd(self.mysql, self.url, nodb=nodb)
         if self.cmds is not None:
             cmd = cmd + self.cmds
+        return cmd
+
+    def execute(self, query: str | None, nodb: bool = False) -> bytes:
+        """Run query and return the raw (tab separated) output of mysql"""
+        if self.procs is not None:
+            return self.session_execute(query, nodb)
         p = subprocess.Popen(
-            cmd,
+            self.command(nodb),
             # stderr=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stdin=subprocess.PIPE,
-            text=True,
         )
-        stdout, stderr = p.communicate(query)
+        stdout, stderr = p.communicate(
+            query.encode("utf-8") if query is not None else None,
+        )
         if p.returncode != 0:
-            stderr = stderr.replace(
-                "mysql: [Warning] Using a password on the command line interface can be insecure.",
-                "",
-            ).strip()
-            raise MySQLError(stderr)
-        ret = []
-        for line in stdout.splitlines():
-            lines = line.split("\t")
-            ret.append(lines)
-        return ret
+            raise MySQLError(errmsg(stderr))
+        return stdout
+
+    def session_execute(self, query: str | None, nodb: bool = False) -> bytes:
+        # the end of the output for this query is marked by selecting SENTINEL
+        assert self.procs is not None
+        p = self.procs.get(nodb)
+        if p is None:
+            p = subprocess.Popen(
+                [*self.command(nodb), "--unbuffered"],
+                stderr=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stdin=subprocess.PIPE,
+            )
+            self.procs[nodb] = p
+        assert p.stdin is not None and p.stdout is not None
+        q = query.strip().rstrip(";") + ";\n" if query and query.strip() else ""
+        try:
+            p.stdin.write(q.encode("utf-8") + b"SELECT '" + SENTINEL + b"';\n")
+            p.stdin.flush()
+        except BrokenPipeError:
+            pass
+        lines: list[bytes] = []
+        for line in iter(p.stdout.readline, b""):
+            if line.rstrip(b"\n") == SENTINEL:
+                p.stdout.readline()  # SENTINEL value
+                return b"".join(lines)
+            lines.append(line)
+        # mysql has quit on an error
+        del self.procs[nodb]
+        _, stderr = p.communicate()
+        raise MySQLError(errmsg(stderr))
+
+    def run(self, query: str | None, nodb: bool = False) -> list[list[str]]:
+        stdout = self.execute(query, nodb=nodb)
+        # decode once and let str.split do the work in C
+        return [line.split("\t") for line in stdout.decode("utf-8").splitlines()]
+
+    def run_single_column(self, query: str, nodb: bool = False) -> list[str]:
+        """Values of a single column result (without the header)"""
+        stdout = self.execute(query, nodb=nodb)
+        return stdout.decode("utf-8").splitlines()[1:]
+
+
+def torunner(url: str | URL | MySQLRunner) -> MySQLRunner:
+    if isinstance(url, MySQLRunner):
+        return url
+    return MySQLRunner(url)
+
 
+@lru_cache(maxsize=64)
+def schema_query(query: str, db: str | None) -> str:
+    return query.format(db=db)
 
-def db_size(url: str | URL, tables: list[str] | None = None) -> int:
-    runner = MySQLRunner(url)
 
-    query = DB_SIZE2.format(db=runner.url.database)
-    ret = runner.run(query)
+def quote(val: str) -> str:
+    v = val.replace("\\", "\\\\").replace("'", "''")
+    return f"'{v}'"
 
-    total = 0
-    for name, num_bytes in ret[1:]:
-        if tables is not None and name not in tables:
-            continue
-        total += int(num_bytes)
-    return total
+
+def in_tables(tables: list[str] | None) -> str:
+    """SQL fragment restricting an information_schema query to `tables`"""
+    if tables is None:
+        return ""
+    if not tables:
+        return "AND FALSE"
+    return f"AND table_name IN ({','.join(quote(t) for t in tables)})"
+
+
+def db_size(url: str | URL | MySQLRunner, tables: list[str] | None = None) -> int:
+    runner = torunner(url)
+
+    # single scalar computed server side: skip building any rows
+    query = schema_query(DB_SIZE3, runner.url.database) + in_tables(tables)
+    stdout = runner.execute(query)
+    return int(stdout.split(b"\n")[1])
 
 
 def db_size_full(
-    url: str | URL,
+    url: str | URL | MySQLRunner,
     tables: list[str] | None = None,
 ) -> list[Dbsize]:
-    runner = MySQLRunner(url)
+    runner = torunner(url)
 
-    query = DB_SIZE.format(db=runner.url.database)
-    ret = runner.run(query)
+    query = schema_query(DB_SIZE, runner.url.database) + in_tables(tables)
+    stdout = runner.execute(query)
     # rows,bytes,index,total, free
+    # int() accepts bytes so only the table name needs decoding
     r: list[Dbsize] = []
-    for row in ret[1:]:
-        name = row[0]
-        if tables is not None and name not in tables:
-            continue
-        vals = [int(r) for r in row[1:]]
+    for line in stdout.splitlines()[1:]:
+        name, *row = line.split(b"\t")
+        vals = [int(r) for r in row]
 
-        r.append(Dbsize(name, *vals))
+        r.append(Dbsize(name.decode("utf-8"), *vals))
     return r
 
 
-def get_db(url: str | URL) -> list[str]:
-    runner = MySQLRunner(url)
-    ret = runner.run("show databases", nodb=True)
-    return [r[0] for r in ret[1:]]
+def get_db(url: str | URL | MySQLRunner) -> list[str]:
+    runner = torunner(url)
+    return runner.run_single_column("show databases", nodb=True)
+
+
+def get_tables(url: str | URL | MySQLRunner) -> list[str]:
+    runner = torunner(url)
+    return runner.run_single_column("show tables")
+
+
+TAB_EXT = ".tar.gz"
+TAB_CHARSET = "utf8mb4"
 
 
-def get_tables(url: str | URL) -> list[str]:
-    runner = MySQLRunner(url)
-    ret = runner.run("show tables")
-    return [r[0] for r in ret[1:]]
+def mysqlload_tab(url: URL, filename: str) -> None:
+    """Load an archive of a `mysqldump --tab` directory.
+
+    The table definitions (.sql) are sourced and the data (.txt)
+    is bulk loaded with LOAD DATA LOCAL INFILE which bypasses
+    the SQL parser. Requires `local_infile=ON` on the server.
+    """
+    import tarfile
+    from tempfile import TemporaryDirectory
+
+    with TemporaryDirectory() as tmpdir:
+        with tarfile.open(filename, "r:gz") as tar:
+            if hasattr(tarfile, "data_filter"):
+                # refuse absolute paths, .. and links out of tmpdir
+                tar.extractall(tmpdir, filter="data")
+            else:
+                tar.extractall(tmpdir)
+        root = Path(tmpdir)
+        script = ["SET FOREIGN_KEY_CHECKS=0;"]
+        script.extend(f"source {sql};" for sql in sorted(root.glob("*.sql")))
+        script.extend(
+            # the .txt files are written in mysqldump_tab's character set
+            # not the database default (latin1 see mysqlload)
+            f"LOAD DATA LOCAL INFILE {quote(str(txt))} INTO TABLE `{txt.stem}`"
+            f" CHARACTER SET {TAB_CHARSET};"
+            for txt in sorted(root.glob("*.txt"))
+        )
+        MySQLRunner(url, cmds=["--local-infile=1"]).execute("\n".join(script))
+
+
+def mysqldump_tab(cmds: list[str], outpath: Path, gzip: list[str]) -> bool:
+    """Run `mysqldump --tab` and archive the directory as a .tar.gz
+
+    The .txt data files are written by the mysql *server* so it must be
+    running on this machine with the FILE privilege granted and
+    `secure_file_priv` must allow writing to the temporary directory
+    (stock MySQL 8 restricts it to /var/lib/mysql-files).
+    """
+    from tempfile import TemporaryDirectory
+
+    tar = which("tar")
+
+    with TemporaryDirectory() as tmpdir:
+        # mysqld (a different user) needs to be able to write here: make it
+        # world writable but sticky so no one can remove anyone else's files
+        os.chmod(tmpdir, 0o1777)
+        pmysql = subprocess.run(
+            [*cmds, f"--default-character-set={TAB_CHARSET}", f"--tab={tmpdir}"],
+            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            check=False,
+        )
+        if pmysql.returncode != 0:
+            raise MySQLError(f"mysqldump --tab failed: {errmsg(pmysql.stderr)}")
+        with outpath.open("wb") as fp:
+            ptar = subprocess.Popen(
+                [tar, "-C", tmpdir, "-cf", "-", "."],
+                stderr=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+            )
+            pgzip = subprocess.Popen(
+                gzip,
+                stdin=ptar.stdout,
+                stderr=subprocess.DEVNULL,
+                stdout=fp,
+            )
+            if ptar.stdout is not None:
+                ptar.stdout.close()
+        return waitfor([ptar, pgzip])
 
 
 def mysqlload(
@@ -202,27 +468,34 @@ def mysqlload(
         url = replace(url, database=database)
     if url.database is None:
         raise ValueError(f"no database {url_str}")
-    zcat = which("zcat")
+    zcat = zcat_cmd(filename)
     mysqlcmd = which("mysql")
 
     filesize = os.stat(filename).st_size
 
-    r = MySQLRunner(url)
+    # one mysql invocation for both statements
+    queries = [f"create database if not exists {url.database} character set=latin1"]
     if drop:
-        r.run(f"drop database if exists {url.database}", nodb=True)
-    r.run(
-        f"create database if not exists {url.database} character set=latin1",
-        nodb=True,
-    )
-
-    pzcat = subprocess.Popen(
-        [zcat, filename],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.DEVNULL,
-    )
+        queries.insert(0, f"drop database if exists {url.database}")
+    MySQLRunner(url).execute(";\n".join(queries), nodb=True)
+
+    if filename.endswith(TAB_EXT):
+        mysqlload_tab(url, filename)
+        return db_size(url), filesize
+
+    with open(filename, "rb") as fp:
+        fadvise(fp.fileno(), "POSIX_FADV_SEQUENTIAL")
+        pzcat = subprocess.Popen(
+            zcat,
+            stdin=fp,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
 
     cmd = mysql_cmd(mysqlcmd, url)
 
+    if pzcat.stdout is not None:
+        grow_pipe(pzcat.stdout.fileno())
     pmysql = subprocess.Popen(cmd, stdin=pzcat.stdout, stderr=subprocess.DEVNULL)
     if pzcat.stdout is not None:
         pzcat.stdout.close()
@@ -236,6 +509,63 @@ def mysqlload(
     return size, filesize
 
 
+def mysqldump_gzip(cmds: list[str], outpath: Path, gzip: list[str]) -> bool:
+    with outpath.open("wb") as fp:
+        pmysql = subprocess.Popen(
+            cmds,
+            stderr=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+        )
+        if pmysql.stdout is not None:
+            grow_pipe(pmysql.stdout.fileno())
+        pgzip = subprocess.Popen(
+            gzip,
+            stdin=pmysql.stdout,
+            stderr=subprocess.DEVNULL,
+            stdout=fp,
+        )
+        if pmysql.stdout is not None:
+            pmysql.stdout.close()
+    return waitfor([pmysql, pgzip])
+
+
+# more concurrent dumps than this just contend for server locks
+MAX_PARALLEL = 6
+
+
+def mysqldump_parallel(
+    cmds: list[str],
+    tables: list[str],
+    outpath: Path,
+    gzip: list[str],
+    parallel: int = 4,
+) -> bool:
+    """Dump each table with its own mysqldump|gzip pipeline, `parallel`
+    (at most MAX_PARALLEL) at a time, then concatenate the parts into outpath.
+
+    Concatenated gzip streams are a valid gzip stream so outpath
+    is an ordinary .sql.gz. Note that each table is dumped in its
+    own transaction so the tables are not a consistent snapshot.
+    """
+    parts = [outpath.with_name(f"{outpath.name}.{i}") for i in range(len(tables))]
+
+    def dump_table(part: Path, table: str) -> bool:
+        return mysqldump_gzip([*cmds, table], part, gzip)
+
+    try:
+        workers = max(1, min(parallel, MAX_PARALLEL, len(tables)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            ok = all(list(executor.map(dump_table, parts, tables)))
+        if ok:
+            with outpath.open("wb") as fp:
+                for part in parts:
+                    with part.open("rb") as pfp:
+                        copyfileobj(pfp, fp)
+        return ok
+    finally:
+        rmfiles([str(part) for part in parts])
+
+
 def mysqldump(
     url_str: str | URL,
     directory: str | None = None,
@@ -243,27 +573,42 @@ def mysqldump(
     tables: list[str] | None = None,
     postfix: str = "",
     database: str | None = None,
+    tab: bool = False,
+    parallel: int = 1,
+    zstd: bool = False,
+    net_buffer_length: int | None = None,
+    compress: bool | None = None,
 ) -> tuple[int, int, str]:
-    from datetime import datetime
-    from .utils import rmfiles
-    from pathlib import Path
-
+    """Dump a database to a .sql.gz file (or, with `tab`, to
+    a .tar.gz of a `mysqldump --tab` directory)
+
+    With `parallel` > 1 up to that many tables are dumped at once.
+    With `zstd` the dump is compressed with multithreaded zstd to
+    a .sql.zst file instead. `net_buffer_length` sets the size of
+    mysqldump's extended INSERT statements (the server loading the dump
+    must have a max_allowed_packet at least this big). `compress` turns
+    on client/server protocol compression; by default it is on only when
+    the server is not local.
+    """
     url = ensure_url(url_str)
     if database is not None:
         url = replace(url, database=database)
+    # the size query runs alongside mysqldump(s): don't let them both prompt
+    url = ask_password(url)
     mysqldumpcmd = which("mysqldump")
-    gzip = which("gzip")
+    if tab and zstd:
+        raise ValueError("can't zstd compress a --tab dump")
+    gzip = gzip_cmd(zstd)
 
     if postfix and not postfix.startswith("-"):
         postfix = "-" + postfix
 
+    ext = TAB_EXT if tab else ".sql" + (ZST_EXT if zstd else ".gz")
     if with_date:
         now = datetime.now()
-        outname = (
-            f"{url.database}{postfix}-{now.year}-{now.month:02}-{now.day:02}.sql.gz"
-        )
+        outname = f"{url.database}{postfix}-{now.year}-{now.month:02}-{now.day:02}{ext}"
     else:
-        outname = f"{url.database}{postfix}.sql.gz"
+        outname = f"{url.database}{postfix}{ext}"
 
     directory = directory or "."
 
@@ -275,65 +620,63 @@ def mysqldump(
     outpath = pth / outname
 
     cmds = mysql_cmd(mysqldumpcmd, url)
-    cmds.extend(["--max_allowed_packet=32M", "--single-transaction"])
-    if tables:
-        cmds.extend(tables)
-
-    with outpath.open("wb") as fp:
-        pmysql = subprocess.Popen(
-            cmds,
-            stderr=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-        )
-        pgzip = subprocess.Popen(
-            [gzip],
-            stdin=pmysql.stdout,
-            stderr=subprocess.DEVNULL,
-            stdout=fp,
-        )
-        if pmysql.stdout is not None:
-            pmysql.stdout.close()
-
-    if not waitfor([pmysql, pgzip]):
-        rmfiles([str(outpath)])
-        raise MySQLError(f"failed to dump database {url.database}")
-
-    filesize = outpath.stat().st_size
-
-    total_bytes = db_size(url, tables)
+    cmds.extend(["--max_allowed_packet=32M", "--single-transaction", "--quick"])
+    if net_buffer_length is not None:
+        cmds.append(f"--net_buffer_length={net_buffer_length}")
+    if compress is None:
+        compress = not is_local(url.host)
+    if compress:
+        cmds.append("--compress")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # the table sizes don't depend on the dump: fetch them while it runs
+        size = executor.submit(db_size, url, tables)
+
+        if tab:
+            ok = mysqldump_tab([*cmds, *(tables or [])], outpath, gzip)
+        elif parallel > 1:
+            ok = mysqldump_parallel(
+                cmds,
+                tables or get_tables(url),
+                outpath,
+                gzip,
+                parallel=parallel,
+            )
+        else:
+            ok = mysqldump_gzip([*cmds, *(tables or [])], outpath, gzip)
+
+        if not ok:
+            rmfiles([str(outpath)])
+            raise MySQLError(f"failed to dump database {url.database}")
+
+        # the dump is write once: don't let it crowd out the page cache
+        with outpath.open("rb") as fp:
+            fadvise(fp.fileno(), "POSIX_FADV_DONTNEED")
+
+        filesize = outpath.stat().st_size
+
+        total_bytes = size.result()
 
     return total_bytes, filesize, outname
 
 
 def analyze(url: URL) -> list[list[str]]:
-    tables = ",".join(get_tables(url))
-    runner = MySQLRunner(url)
-
-    return runner.run(f"analyze table {tables}")
+    with MySQLRunner(url) as runner:
+        tables = ",".join(get_tables(runner))
+        return runner.run(f"analyze table {tables}")
 
 
 def tabulate(result: list[list[str]]) -> None:
-    def pad(val: str, length: int) -> str:
-        p = " " * (length + 1 - len(val))
-        return f"{val}{p}"
-
     if not result:
         return
-    max_lengths = [0] * len(result[0])
+    widths = [max(map(len, col)) + 1 for col in zip(*result)]
 
-    for row in result:
-        lengths = [len(r) for r in row]
-        max_lengths = [max(l1, l2) for l1, l2 in zip(lengths, max_lengths)]
+    lines = [" ".join(v.ljust(w) for v, w in zip(row, widths)) for row in result]
+    lines.insert(1, " ".join("=" * w for w in widths))
+    click.echo("\n".join(lines))
 
-    for idx, row in enumerate(result):
-        row = [pad(v, l) for v, l in zip(row, max_lengths)]
-        print(" ".join(row))
-        if idx == 0:
-            row = ["=" * (n + 1) for n in max_lengths]
-            print(" ".join(row))
 
-
-def totables(url: URL, tables: tuple[str, ...]) -> list[str] | None:
+def totables(url: URL | MySQLRunner, tables: tuple[str, ...]) -> list[str] | None:
     only = [t.strip() for tt in tables for t in tt.split(",") if t.strip()]
     if not only:
         return None
@@ -382,36 +725,43 @@ def db_size_cmd(
     if database is not None:
         url = replace(url, database=database)
 
-    only = totables(url, tables)
+    with MySQLRunner(url) as runner:
+        only = totables(runner, tables)
+        if summary:
+            total = db_size(runner, only)
+        else:
+            ret = db_size_full(runner, only)
 
     if summary:
-        total = db_size(url, only)
         click.echo(str(total) if asbytes else human(total))
     else:
-        ret = db_size_full(url, only)
-        ret = sorted(ret, key=lambda t: -t.total)
-        tot = Dbsize(
-            table_name="Total",
-            table_rows=sum(r.table_rows for r in ret),
-            data_length=sum(r.data_length for r in ret),
-            index_length=sum(r.index_length for r in ret),
-            data_free=sum(r.data_free for r in ret),
-        )
-        ret.append(tot)
+        ret.sort(key=lambda t: t.total, reverse=True)
+        # sum each numeric column of the transposed rows
+        cols = list(zip(*ret))[1:] or [()] * 4
+        ret.append(Dbsize("Total", *map(sum, cols)))
         mx = max(len(r.table_name) for r in ret)
 
-        for r in ret:
-            pad = " " * (mx - len(r.table_name))
-            v = str(r.total) if asbytes else human(r.total)
-            click.echo(f"{r.table_name} {pad}: {v}")
+        click.echo(
+            "\n".join(
+                f"{r.table_name:<{mx}} : {r.total if asbytes else human(r.total)}"
+                for r in ret
+            ),
+        )
 
 
 @mysql.command()
+@click.option(
+    "--sort/--no-sort",
+    default=True,
+    help="sort by name (or in server order)",
+    show_default=True,
+)
 @pass_mysql
-def databases(db: MySQL) -> None:
+def databases(db: MySQL, sort: bool) -> None:
     """List databases from URL."""
-    for database in sorted(get_db(db.url)):
-        print(database)
+    dbs = get_db(db.url)
+    if dbs:
+        click.echo("\n".join(sorted(dbs) if sort else dbs))
 
 
 @mysql.command(name="analyze")
@@ -434,7 +784,7 @@ def analyze_cmd(db: MySQL, database: str | None) -> None:
 )
 @pass_mysql
 def mysqload_cmd(db: MySQL, filename: str, drop: bool, database: str | None) -> None:
-    """Load a mysqldump."""
+    """Load a mysqldump (.sql.gz, .sql.zst or a --tab .tar.gz)."""
 
     total_bytes, filesize = mysqlload(db.url, filename, drop=drop, database=database)
     click.secho(
@@ -449,6 +799,34 @@ def mysqload_cmd(db: MySQL, filename: str, drop: bool, database: str | None) ->
 @click.option("--with-date", is_flag=True, help="add a date stamp to filename")
 @click.option("-t", "--tables", help="comma separated list of tables", multiple=True)
 @click.option("-d", "--database", help="database to use (instead of url)")
+@click.option(
+    "--tab",
+    is_flag=True,
+    help="dump as a .tar.gz of per table schema/data files"
+    " (server must be local and its secure_file_priv must allow $TMPDIR)",
+)
+@click.option(
+    "--net-buffer-length",
+    type=int,
+    help="mysqldump buffer size (bytes) for extended inserts e.g. 16777216",
+)
+@click.option(
+    "--zstd",
+    is_flag=True,
+    help="compress with zstd to DATABASE.sql.zst (instead of .sql.gz)",
+)
+@click.option(
+    "-j",
+    "--parallel",
+    default=1,
+    help=f"number of tables to dump concurrently (max {MAX_PARALLEL})",
+    show_default=True,
+)
+@click.option(
+    "--wire-compress/--no-wire-compress",
+    default=None,
+    help="compress the mysql protocol [default: only if the server is remote]",
+)
 @click.argument("directory", required=False)
 @pass_mysql
 def mysqldump_cmd(
@@ -458,8 +836,15 @@ def mysqldump_cmd(
     postfix: str,
     tables: tuple[str, ...],
     database: str | None,
+    tab: bool,
+    parallel: int,
+    zstd: bool,
+    net_buffer_length: int | None,
+    wire_compress: bool | None,
 ) -> None:
     """Generate a mysqldump to a directory."""
+    if tab and zstd:
+        raise click.BadParameter("can't specify --tab *and* --zstd")
     url = db.url
     if database is not None:
         url = replace(url, database=database)
@@ -472,7 +857,11 @@ def mysqldump_cmd(
         with_date=with_date,
         tables=tbls,
         postfix=postfix,
-        database=database,
+        tab=tab,
+        parallel=parallel,
+        zstd=zstd,
+        net_buffer_length=net_buffer_length,
+        compress=wire_compress,
     )
     click.secho(
         f"dumped {human(total_bytes)} > {human(filesize)} as {outname}",
@@ -16,5 +16,6 @@ def secret(size: int) -> None:
     """Generate secret keys for Flask apps"""
     from secrets import token_bytes
 
-    print("SECRET_KEY =", token_bytes(size))
-    print("SECURITY_PASSWORD_SALT =", token_bytes(size))
+    buf = token_bytes(size * 2)  # one read from the kernel RNG for both
+    print("SECRET_KEY =", buf[:size])
+    print("SECURITY_PASSWORD_SALT =", buf[size:])
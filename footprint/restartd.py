@@ -7,25 +7,31 @@ import click
 from .cli import cli
 from .utils import which
 
+DEAD_STATES = frozenset({"inactive", "failed"})
+
 
 def restart_userd() -> list[tuple[str, int]]:
     """Restart any user systemd files"""
     import os
+    from concurrent.futures import ThreadPoolExecutor
     from os.path import isdir, join
 
     from .utils import userdir as u
 
     userdir = u()
 
-    status: list[tuple[str, int]] = []
-
     systemctl = which("systemctl")
 
-    for f in os.listdir(userdir):
-        if isdir(join(userdir, f)):  # skip directories
-            continue
-        if "@" in f:
-            continue
+    def start(f: str) -> tuple[str, int]:
+        r = subprocess.run(
+            [systemctl, "--user", "start", f],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        return (f, r.returncode)
+
+    def restart(f: str) -> tuple[str, int] | None:
         r = subprocess.run(
             [systemctl, "--user", "status", f],
             stdout=subprocess.DEVNULL,
@@ -34,18 +40,34 @@ def restart_userd() -> list[tuple[str, int]]:
         )
         # 4 unknown, 3 dead?
         if r.returncode == 3:
-            # rep = r.stdout.strip()
-            r = subprocess.run(
-                [systemctl, "--user", "start", f],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=False,
-            )
-            status.append((f, r.returncode))
+            return start(f)
         elif r.returncode != 0:
-            status.append((f, r.returncode))
+            return (f, r.returncode)
+        return None
+
+    files = [
+        f
+        for f in os.listdir(userdir)
+        if not isdir(join(userdir, f)) and "@" not in f  # skip directories
+    ]
+    if not files:
+        return []
+
+    # one systemctl call for the state of every unit (one line per unit)
+    states = subprocess.run(
+        [systemctl, "--user", "is-active", *files],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        check=False,
+        text=True,
+    ).stdout.split()
 
-    return status
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+        if len(states) == len(files):
+            dead = [f for f, s in zip(files, states) if s in DEAD_STATES]
+            return list(executor.map(start, dead))
+        # unexpected output: probe (and restart) each unit concurrently
+        return [r for r in executor.map(restart, files) if r is not None]
 
 
 @cli.command()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from os.path import isdir
+from os.path import isfile
 from os.path import join
 from typing import Any
 from typing import TextIO
@@ -8,13 +10,20 @@ from typing import TYPE_CHECKING
 
 import click
 
+from .core import topath
 from .systemd import asuser_option
+from .systemd import check_app_dir
+from .systemd import check_venv_dir
 from .systemd import CHECKTYPE
 from .systemd import config
 from .systemd import config_options
 from .systemd import DEFAULTTYPE
 from .systemd import make_args
+from .systemd import systemd
 from .systemd import template_option
+from .templating import get_templates
+from .utils import maybe_closing
+from .utils import rmfiles
 
 if TYPE_CHECKING:
     from jinja2 import Template
@@ -65,6 +74,34 @@ footprint config systemd-celery /var/www/website3/repo venv=/home/ianc/miniconda
 """
 
 
+def isadir(key: str, s: Any) -> str | None:
+    if not isdir(s):
+        return f"{key}: {s} is not a directory"
+    return None
+
+
+def is_julia(key: str, s: Any) -> str | None:
+    if os.access(join(s, "bin", "julia"), os.X_OK | os.R_OK):
+        return None
+    # only stat the directory itself to explain the failure
+    if not isdir(s):
+        return f"{key}: {s} is not a directory"
+    return f"{key}: {s} is not a *julia* directory"
+
+
+SUPERVISOR_CHECKS: list[tuple[str, CHECKTYPE]] = [
+    ("julia_dir", is_julia),
+    ("depot_path", isadir),
+]
+
+SUPERVISOR_DEFAULTS: list[tuple[str, DEFAULTTYPE]] = [
+    ("depot_path", lambda params: f'{params["homedir"]}/.julia'),
+    ("workers", lambda _: 4),
+    ("gevent", lambda _: False),
+    ("stopwait", lambda _: 10),
+]
+
+
 # pylint: disable=too-many-branches too-many-locals
 def supervisor(  # noqa: C901
     template: str | Template,
@@ -80,35 +117,9 @@ def supervisor(  # noqa: C901
     asuser: bool = False,
     default_values: list[tuple[str, DEFAULTTYPE]] | None = None,
 ) -> str:
-    import os
-
-    from .systemd import systemd
-    from .core import topath
+    schecks = [*SUPERVISOR_CHECKS, *(checks or [])]
 
-    def isadir(key: str, s: Any) -> str | None:
-        if not isdir(s):
-            return f"{key}: {s} is not a directory"
-        return None
-
-    def is_julia(key: str, s: Any) -> str | None:
-        if not isdir(s):
-            return f"{key}: {s} is not a directory"
-        if not os.access(join(s, "bin", "julia"), os.X_OK | os.R_OK):
-            return f"{key}: {s} is not a *julia* directory"
-        return None
-
-    schecks: list[tuple[str, CHECKTYPE]] = [
-        ("julia_dir", is_julia),
-        ("depot_path", isadir),
-    ]
-    schecks.extend(checks or [])
-
-    defaults = [
-        ("depot_path", lambda params: f'{params["homedir"]}/.julia'),
-        ("workers", lambda _: 4),
-        ("gevent", lambda _: False),
-        ("stopwait", lambda _: 10),
-    ]
+    defaults = SUPERVISOR_DEFAULTS
     if default_values:
         defaults = [*default_values, *defaults]
 
@@ -141,9 +152,6 @@ def supervisord(
     ignore_unknowns: bool = False,
     asuser: bool = False,
 ) -> None:
-    from .templating import get_templates
-    from .utils import maybe_closing, rmfiles
-
     templates = get_templates(template or "supervisor.ini")
     application_dir = application_dir or "."
 
@@ -218,21 +226,17 @@ def systemd_celery(
     output: str | None,
     asuser: bool,
 ) -> None:
-    import os
-    from os.path import isfile
-
-    from .systemd import check_app_dir, check_venv_dir, systemd
-
     application_dir = application_dir or "."
 
     def find_celery(params: dict[str, Any]) -> str | None:
         assert application_dir is not None
-        for d in os.listdir(application_dir):
-            fd = join(application_dir, d)
-            if isdir(fd):
-                for mod in ["celery", "tasks"]:
-                    if isfile(join(fd, f"{mod}.py")):
-                        return f"{d}.{mod}"
+        # DirEntry.is_dir() uses the d_type from readdir: no stat per entry
+        with os.scandir(application_dir) as it:
+            for entry in it:
+                if entry.is_dir():
+                    for mod in ["celery", "tasks"]:
+                        if isfile(join(entry.path, f"{mod}.py")):
+                            return f"{entry.name}.{mod}"
         return None
 
     def check_celery(venv: str) -> str | None:
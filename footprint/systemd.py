@@ -5,11 +5,13 @@ import re
 import subprocess
 import sys
 from collections.abc import Sequence
+from functools import lru_cache
 from os.path import isdir
 from os.path import isfile
 from os.path import join
 from os.path import split
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any
 from typing import Callable
 from typing import Dict
@@ -44,7 +46,9 @@ if TYPE_CHECKING:
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-NUM = re.compile(r"^[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?$")
+NUM = re.compile(r"^[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?$", re.ASCII)
+# only values starting with one of these can match NUM
+NUM_START = frozenset("+-.0123456789")
 
 CONVERTER = Callable[[Any], Any]
 
@@ -72,7 +76,7 @@ def fix_kv(
             return (key, True)
         if value == "false":
             return (key, False)
-        if NUM.match(value):
+        if value[0] in NUM_START and NUM.match(value):
             return (key, float(value))
         return (key, value)
 
@@ -82,6 +86,11 @@ def fix_kv(
     return key, v
 
 
+def isint(s: Any) -> bool:
+    # values arrive as str or already converted by fix_kv (maybe a float)
+    return isinstance(s, int) or (isinstance(s, str) and s.isdigit())
+
+
 def fix_params(
     params: list[str],
     convert: dict[str, CONVERTER] | None = None,
@@ -115,11 +124,13 @@ def url_match(directory: str, exclude: Sequence[str] | None = None) -> str:
 
     dirs = set(Config.static_dir.split("|"))
     files = set(Config.static_files.split("|"))
-    for f in os.listdir(directory):
-        if f in sexclude:
-            continue
-        tl = dirs if isdir(join(directory, f)) else files
-        tl.add(f.replace(".", r"\."))
+    with os.scandir(directory) as it:
+        for e in it:
+            if e.name in sexclude:
+                continue
+            # is_dir() only needs a stat for symlinks
+            tl = dirs if e.is_dir() else files
+            tl.add(e.name.replace(".", r"\."))
 
     d = "|".join(dirs)
     f = "|".join(files)
@@ -133,12 +144,22 @@ def find_favicon(application_dir: str) -> str | None:
     Config = get_config()
 
     static = {s.replace(r"\.", ".") for s in Config.static_files.split("|")}
-    for d, _, files in os.walk(application_dir):
-        if d.startswith((".", "_")):
+    # top down like os.walk but DirEntry gives us the file type without a stat
+    stack = [application_dir]
+    while stack:
+        d = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    if e.is_dir(follow_symlinks=False):
+                        if not e.name.startswith((".", "_")):
+                            subdirs.append(e.path)
+                    elif e.name in static:
+                        return d
+        except OSError:
             continue
-        for f in files:
-            if f in static:
-                return d
+        stack.extend(reversed(subdirs))
     return None
 
 
@@ -158,21 +179,26 @@ def check_venv_dir(venv_dir: str) -> str | None:
     return None
 
 
-def footprint_config(application_dir: str) -> dict[str, Any]:
-    def dot_env(f: str) -> dict[str, Any]:
-        cfg = get_dot_env(f)
-        if cfg is None:
-            return {}
-        return dict(
-            fix_kv(k.lower(), [v])
-            for k, v in cfg.items()
-            if k.isupper() and v is not None
-        )
+@lru_cache(maxsize=32)
+def dot_env_config(f: str, mtime_ns: int) -> dict[str, Any]:
+    # mtime_ns is only part of the cache key: an edited file is re-read
+    cfg = get_dot_env(f)
+    if cfg is None:
+        return {}
+    return dict(
+        fix_kv(k.lower(), [v]) for k, v in cfg.items() if k.isupper() and v is not None
+    )
+
 
+def footprint_config(application_dir: str) -> dict[str, Any]:
     f = join(application_dir, ".flaskenv")
-    if not isfile(f):
+    try:
+        st = os.stat(f)
+    except OSError:
+        return {}
+    if not S_ISREG(st.st_mode):
         return {}
-    return dot_env(f)
+    return dot_env_config(f, st.st_mtime_ns)
 
 
 def get_default_venv() -> str:
@@ -191,12 +217,15 @@ CHECKTYPE = Callable[[str, Any], Optional[str]]
 DEFAULTTYPE = Callable[[Dict[str, Any]], Any]
 
 
+@lru_cache(maxsize=None)
 def getgroup(username: str) -> str | None:
+    import grp
+    import pwd
+
     try:
         # username might not exist on this machine
-        ret = subprocess.check_output(["id", "-gn", username], text=True).strip()
-        return ret
-    except subprocess.CalledProcessError:
+        return grp.getgrgid(pwd.getpwnam(username).pw_gid).gr_name
+    except KeyError:
         return None
 
 
@@ -212,11 +241,12 @@ def make_args(argsd: dict[str, str], **kwargs: Any) -> str:
             return s
         return click.style(s, fg=Config.arg_color)
 
-    args = list((k, v) for k, v in chain(argsd.items(), kwargs.items()))
+    args = list(chain(argsd.items(), kwargs.items()))
 
     argl = [(color(k), v) for k, v in args]
-    aw = len(max(argl, key=lambda t: len(t[0]))[0]) + 1
-    bw = len(max(args, key=lambda t: len(t[0]))[0]) + 1
+    bw = max(len(k) for k, _ in args) + 1
+    # the color escape codes add the same width to every argument
+    aw = bw + len(color(""))
     sep = "\n  " + (" " * bw)
 
     def fixd(d: str) -> str:
@@ -286,37 +316,52 @@ def systemd_install(
             check=check,
         ).returncode
 
-    failed = []
-    for systemdfile in systemdfiles:
-        service = split(systemdfile)[-1]
-        exists = isfile(f"{location}/{service}")
-        if not exists or not filecmp.cmp(f"{location}/{service}", systemdfile):
-            if exists:
-                click.secho(f"warning: overwriting old {service}", fg="yellow")
-
-                ret = systemctlcmd("stop", service, check=False)
-
-                if ret != 0:
-                    click.secho(
-                        "failed to stop old process [already stopped?]",
-                        fg="yellow",
-                        err=True,
-                    )
-            # will throw....
-            sudocmd("cp", systemdfile, location)
-            systemctlcmd("daemon-reload")
-            systemctlcmd("enable", service)
-            systemctlcmd("start", service)
-            if systemctlcmd("status", service):
+    failed: list[str] = []
+    installed: list[tuple[str, str]] = []
+
+    def activate() -> None:
+        # one reload for all the new unit files
+        systemctlcmd("daemon-reload")
+        for systemdfile, service in installed:
+            ret = systemctlcmd("enable", "--now", service, check=False)
+            if ret or systemctlcmd("status", service, check=False):
                 systemctlcmd("disable", service, check=False)
                 sudocmd("rm", f"{location}/{service}")
-                systemctlcmd("daemon-reload")
 
-                click.secho("systemd configuration faulty", fg="red", err=True)
+                click.secho(
+                    f"systemd configuration faulty: {service}",
+                    fg="red",
+                    err=True,
+                )
                 failed.append(systemdfile)
+        if failed:
+            systemctlcmd("daemon-reload")
 
-        else:
-            click.secho(f"systemd file {service} unchanged", fg="green")
+    try:
+        for systemdfile in systemdfiles:
+            service = split(systemdfile)[-1]
+            exists = isfile(f"{location}/{service}")
+            if not exists or not filecmp.cmp(f"{location}/{service}", systemdfile):
+                if exists:
+                    click.secho(f"warning: overwriting old {service}", fg="yellow")
+
+                    ret = systemctlcmd("stop", service, check=False)
+
+                    if ret != 0:
+                        click.secho(
+                            "failed to stop old process [already stopped?]",
+                            fg="yellow",
+                            err=True,
+                        )
+                # will throw....
+                sudocmd("cp", systemdfile, location)
+                installed.append((systemdfile, service))
+            else:
+                click.secho(f"systemd file {service} unchanged", fg="green")
+    finally:
+        # even if a later cp failed: don't leave copied files unloaded
+        if installed:
+            activate()
     return failed
 
 
@@ -360,6 +405,9 @@ def nginx_install(nginxfile: str) -> str | None:
     return conf
 
 
+STOPPED_STATES = frozenset({"inactive", "failed"})
+
+
 def systemd_uninstall(
     systemdfiles: list[str],
     asuser: bool = False,
@@ -385,6 +433,18 @@ def systemd_uninstall(
             check=check,
         ).returncode
 
+    def is_stopped(unit: str) -> bool:
+        # a read only query: doesn't need sudo even for system units.
+        # anything else (e.g. "activating" while crash looping) needs a stop
+        opt = ["--user"] if asuser else []
+        r = subprocess.run(
+            [systemctl, *opt, "is-active", unit],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        return r.stdout.strip() in STOPPED_STATES
+
     failed = []
     changed = False
     for sdfile in systemdfiles:
@@ -395,7 +455,10 @@ def systemd_uninstall(
         if not isfile(filename):
             click.secho(f"no systemd service {systemdfile}", fg="yellow", err=True)
         else:
-            ret = systemctlcmd("stop", systemdfile, check=False)
+            if is_stopped(systemdfile):
+                ret = 0  # skip the (sudo) stop
+            else:
+                ret = systemctlcmd("stop", systemdfile, check=False)
             if ret != 0 and ret != 5:
                 failed.append(sdfile)
             if ret == 0:
@@ -536,9 +599,6 @@ def systemd(  # noqa: C901
                     params[key] = v
                     known.add(key)
 
-        def isint(s: str | int) -> bool:
-            return isinstance(s, int) or s.isdigit()
-
         if "host" in params:
             h = params["host"]
             if isint(h):
@@ -546,7 +606,7 @@ def systemd(  # noqa: C901
 
         if check:
             if not ignore_unknowns:
-                extra = set(params) - known
+                extra = params.keys() - known
                 if extra:
                     raise click.BadParameter(
                         f"unknown arguments {extra}",
@@ -569,8 +629,8 @@ def systemd(  # noqa: C901
                             err=True,
                         )
                         failed.append(key)
-                if failed:
-                    raise click.Abort()
+            if failed:
+                raise click.Abort()
 
         if "asuser" not in params:
             params["asuser"] = asuser
@@ -700,9 +760,7 @@ def to_output(res: str, output: str | TextIO | None = None) -> None:
         res += "\n"
     if output:
         if isinstance(output, str):
-            with open(output, "w", encoding="utf-8") as fp:
-                fp.write(res)
-
+            Path(output).write_text(res, encoding="utf-8")
         else:
             output.write(res)
     else:
@@ -798,7 +856,7 @@ def nginx(  # noqa: C901
 
         if "host" in params:
             h = params["host"]
-            if isinstance(h, int) or h.isdigit():
+            if isint(h):
                 params["host"] = f"127.0.0.1:{h}"
 
         if root_location_match is not None and "root_location_match" not in params:
@@ -809,8 +867,8 @@ def nginx(  # noqa: C901
             and application_dir is not None
         ):
             d = find_favicon(application_dir)
-            if d:
-                params["favicon"] = topath(join(application_dir, d))
+            if d:  # normalized below
+                params["favicon"] = join(application_dir, d)
 
         if "favicon" in params:
             params["favicon"] = topath(params["favicon"])
@@ -821,7 +879,7 @@ def nginx(  # noqa: C901
                 raise click.BadParameter(msg, param_hint="application_dir")
 
             if not ignore_unknowns:
-                extra = set(params) - known
+                extra = params.keys() - known
                 if extra:
                     raise click.BadParameter(
                         f"unknown arguments {extra}",
@@ -844,8 +902,8 @@ def nginx(  # noqa: C901
                             err=True,
                         )
                         failed.append(key)
-                if failed:
-                    raise click.Abort()
+            if failed:
+                raise click.Abort()
 
         res = template.render(**params)  # pylint: disable=no-member
         to_output(res, output)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from os.path import dirname
 from os.path import join
 from typing import Any
@@ -20,11 +21,13 @@ def get_template_filename(name: str) -> str:
     return join(templates_dir(), name)
 
 
+# templates are compiled once per Environment so keep one per directory
+@lru_cache(maxsize=None)
 def get_env(application_dir: str | None = None) -> Environment:
     import datetime
     import sys
 
-    from jinja2 import FileSystemLoader, StrictUndefined
+    from jinja2 import FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
 
     def ujoin(*args: Any) -> str:
         for path in args:
@@ -52,7 +55,16 @@ def get_env(application_dir: str | None = None) -> Environment:
     templates = [templates_dir()]
     if application_dir:
         templates = [application_dir, *templates]
-    env = Environment(undefined=StrictUndefined, loader=FileSystemLoader(templates))
+    env = Environment(
+        undefined=StrictUndefined,
+        loader=FileSystemLoader(templates),
+        # compiled templates persist (per user, in $TMPDIR) between runs;
+        # entries are keyed on the template source so edits invalidate them
+        bytecode_cache=FileSystemBytecodeCache(),
+        # environments are cached (get_env) but live only as long as one
+        # command so don't re-stat a template every time it is requested
+        auto_reload=False,
+    )
 
     def maybe_colon(s: str | StrictUndefined) -> str:
         if isinstance(s, StrictUndefined):
@@ -23,30 +23,31 @@ class URL:
 # https://github.com/sqlalchemy/sqlalchemy/blob/7fdaf711dc6bd578f7becf45526dce70f523890d/lib/sqlalchemy/engine/url.py#L821
 
 
-def make_url(name_or_url: str | URL) -> URL | None:
-    if isinstance(name_or_url, URL):
-        return name_or_url
-    pattern = re.compile(
-        r"""
-            (?P<name>[\w\+]+)://
-            (?:
-                (?P<username>[^:/]*)
-                (?::(?P<password>[^@]*))?
-            @)?
+URL_PATTERN = re.compile(
+    r"""
+        (?P<name>[\w\+]+)://
+        (?:
+            (?P<username>[^:/]*)
+            (?::(?P<password>[^@]*))?
+        @)?
+        (?:
             (?:
-                (?:
-                    \[(?P<ipv6host>[^/\?]+)\] |
-                    (?P<ipv4host>[^/:\?]+)
-                )?
-                (?::(?P<port>[^/\?]*))?
+                \[(?P<ipv6host>[^/\?]+)\] |
+                (?P<ipv4host>[^/:\?]+)
             )?
-            (?:/(?P<database>[^\?]*))?
-            (?:\?(?P<query>.*))?
-            """,
-        re.X,
-    )
+            (?::(?P<port>[^/\?]*))?
+        )?
+        (?:/(?P<database>[^\?]*))?
+        (?:\?(?P<query>.*))?
+        """,
+    re.X,
+)
 
-    m = pattern.match(name_or_url)
+
+def make_url(name_or_url: str | URL) -> URL | None:
+    if isinstance(name_or_url, URL):
+        return name_or_url
+    m = URL_PATTERN.match(name_or_url)
     if m is None:
         return None
 
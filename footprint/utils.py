@@ -7,6 +7,7 @@ import subprocess
 from contextlib import contextmanager
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from shutil import which as shwitch
 from threading import Thread
 from typing import Any
@@ -36,9 +37,10 @@ def rmfiles(files: list[str]) -> None:
 
 
 def get_pass(VAR: str, msg: str) -> str:
-    if VAR not in os.environ:
+    pw = os.environ.get(VAR)
+    if pw is None:
         return getpass.getpass(f"{msg} password: ")
-    return os.environ[VAR]
+    return pw
 
 
 def multiline_comment(comment: str) -> list[str]:
@@ -62,6 +64,7 @@ def flatten_toml(d: dict[str, Any]) -> dict[str, Any]:
     return dict(inner(d))
 
 
+@lru_cache(maxsize=None)
 def gethomedir(user: str = "") -> str:
     return os.path.expanduser(f"~{user}")
 
@@ -122,8 +125,11 @@ class Runner:
         return self.run()
 
 
+LOCALHOSTS = frozenset({None, "127.0.0.1", "localhost", "::1"})
+
+
 def is_local(machine: str | None) -> bool:
-    return machine in {None, "127.0.0.1", "localhost"}
+    return machine in LOCALHOSTS
 
 
 T = TypeVar("T")
@@ -156,8 +162,15 @@ def get_variables(template: Template) -> set[str]:
     return meta.find_undeclared_variables(ast)
 
 
+@lru_cache(maxsize=None)
+def which_opt(cmd: str) -> str | None:
+    """Path to an optional executable (or None)"""
+    # executables don't move during a run: only walk $PATH once per name
+    return shwitch(cmd)
+
+
 def which(cmd: str) -> str:
-    ret = shwitch(cmd)
+    ret = which_opt(cmd)
     if ret is None:
         click.secho(f"no executable {cmd}!", fg="red", err=True)
         raise click.Abort()
@@ -170,6 +170,7 @@ def watch(
     is_test: bool,
 ) -> None:
     """Install a crontab watch on low memory and diskspace [**requires psutil**]"""
+    import shlex
     import sys
     from .utils import require_mod
     from .config import get_config
@@ -193,10 +194,23 @@ def watch(
         raise click.BadArgumentUsage("email must be present if --crontab specified")
     tme = make_cron_interval(interval)
 
-    C = (
-        f"{tme} {sys.executable}"
-        f" -m footprint watch -m {mailhost} -t {mem_threshold} -d {disk_threshold} {email} 1>/dev/null 2>&1"
+    # cron hands this line to a shell so quote the arguments
+    cmd = shlex.join(
+        [
+            sys.executable,
+            "-m",
+            "footprint",
+            "watch",
+            "-m",
+            mailhost,
+            "-t",
+            str(mem_threshold),
+            "-d",
+            str(disk_threshold),
+            email,
+        ],
     )
+    C = f"{tme} {cmd} 1>/dev/null 2>&1"
     if is_test:
         click.echo(C)
     else: